@@ -1,22 +1,53 @@
-import inspect
+import atexit
 import json
 import logging
 import os
+import queue
 import sys
 import traceback
 from datetime import datetime
-from functools import wraps
-from logging.handlers import RotatingFileHandler
-from threading import Lock
-from typing import Any, Callable, Dict, Optional, TypeVar, Union
+from functools import lru_cache, wraps
+from threading import Lock, Thread
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
+import orjson
 import pytz
 from colorama import Fore, Style
 
+from .pie_file_handler import PieFileHandler
 from .pie_log_level import PieLogLevel
 
 T = TypeVar('T')  # For generic return type in decorator
 
+# A fully formatted record handed to the background writer thread:
+# (level, message, timestamp, level_name, file_path_info, details_str, context_str, exception_str, colorful)
+_LogRecord = Tuple[int, str, str, str, str, Optional[str], Optional[str], Optional[str], Optional[bool]]
+
+
+@lru_cache(maxsize=None)
+def _resolve_project_root(caller_filename: str) -> str:
+    """
+    Resolve the project root for a logger constructed from the given file.
+
+    The PIE_LOG_PROJECT_ROOT environment variable overrides the caller-based
+    detection entirely, which is handy in containerized deployments. Results
+    are cached per caller file so repeated logger construction from the same
+    module skips the path syscalls.
+    """
+    env_root = os.environ.get('PIE_LOG_PROJECT_ROOT')
+    if env_root:
+        return os.path.abspath(env_root)
+    return os.path.dirname(os.path.abspath(caller_filename))
+
+
+def _disabled_log(
+        message: str,
+        details: Optional[Any] = None,
+        print_exception: Union[bool, BaseException] = False,
+        colorful: Optional[bool] = None
+) -> None:
+    """No-op bound in place of level methods filtered out by minimum_log_level."""
+
 
 class PieLogger:
     """
@@ -51,12 +82,13 @@ class PieLogger:
             colorful: bool = True,
             minimum_log_level: int = PieLogLevel.INFO,
             default_log_color: Fore = Fore.WHITE,
-            details_indent: int = 2,
+            details_indent: int = 0,
             log_to_file: bool = True,
             relative_log_directory_path: str = 'logs',
             log_file_size_limit: int = 32 * 1024 * 1024,
             max_backup_files: int = 0,
             global_context: bool = False,
+            use_uring: bool = False,
     ) -> None:
         """
         Initialize a new Logger instance with customizable formatting, color and output options.
@@ -78,54 +110,142 @@ class PieLogger:
             colorful (bool): Enable/disable colored output (default: True)
             minimum_log_level (int): Minimum logging level (default: PieLogLevel.INFO)
             default_log_color (Fore): Fallback color when colorful is False (default: Fore.WHITE)
-            details_indent (int): Spaces for JSON indentation (default: 2)
+            details_indent (int): Spaces for JSON indentation; 0 emits compact single-line JSON,
+                which is considerably cheaper to serialize (default: 0)
             log_to_file (bool): Enable/disable file logging (default: True)
             relative_log_directory_path (str): Directory for log files (default: 'logs')
             log_file_size_limit (int): Maximum size for log files in bytes (default: 32 MB = 32 * 1024 * 1024)
             max_backup_files (int): Number of backup log files to keep (default: 0)
             global_context (bool): Enable/disable global context logging (default: False)
+            use_uring (bool): Write the log file through io_uring instead of the buffered
+                handler; Linux only, requires the optional liburing package and falls back
+                to the buffered handler when unavailable (default: False)
         """
         self._start_timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
 
         self._logger_name = logger_name
         self._timezone = timezone
+        self._tz = pytz.timezone(timezone) if timezone else pytz.utc
         self._timestamp_padding = timestamp_padding
         self._log_level_padding = log_level_padding
         self._file_path_padding = file_path_padding
         self._colorful = colorful
+        # When stdout is piped or redirected (CI, docker logs, journald) the
+        # ANSI codes are wasted bytes, so color is only on for real terminals.
+        self._effective_colorful = colorful and getattr(sys.stdout, 'isatty', lambda: False)()
         self._minimum_log_level = minimum_log_level
-        self._default_log_color = default_log_color
+        self._default_log_color = str(default_log_color)
         self._details_indent = details_indent
+        self._orjson_opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if details_indent:
+            self._orjson_opts |= orjson.OPT_INDENT_2
         self._log_lock = Lock()
 
-        frame = inspect.currentframe()
-        if frame:
-            outer_frame = inspect.getouterframes(frame)[1]
-            self._initialization_directory = os.path.dirname(os.path.abspath(outer_frame.filename))
-        else:
+        try:
+            self._initialization_directory = _resolve_project_root(sys._getframe(1).f_code.co_filename)
+        except ValueError:
             self._initialization_directory = os.getcwd()
 
         self._project_root = self._initialization_directory
 
         self.console_logger: logging.Logger
-        self._debug_log_color = debug_log_color
-        self._info_log_color = info_log_color
-        self._warning_log_color = warning_log_color
-        self._error_log_color = error_log_color
-        self._critical_log_color = critical_log_color
-        self._timestamp_log_color = timestamp_log_color
-        self._file_path_log_color = file_path_log_color
-        self._details_log_color = details_log_color
+        # Colorama's codes are snapshotted as plain str once, so the hot path
+        # concatenates interned string constants instead of going through the
+        # ANSI proxy's attribute machinery.
+        self._debug_log_color = str(debug_log_color)
+        self._info_log_color = str(info_log_color)
+        self._warning_log_color = str(warning_log_color)
+        self._error_log_color = str(error_log_color)
+        self._critical_log_color = str(critical_log_color)
+        self._timestamp_log_color = str(timestamp_log_color)
+        self._file_path_log_color = str(file_path_log_color)
+        self._details_log_color = str(details_log_color)
+        self._reset = str(Style.RESET_ALL)
+
+        self._level_colors: Dict[int, Fore] = {
+            PieLogLevel.DEBUG: self._debug_log_color,
+            PieLogLevel.INFO: self._info_log_color,
+            PieLogLevel.WARNING: self._warning_log_color,
+            PieLogLevel.ERROR: self._error_log_color,
+            PieLogLevel.CRITICAL: self._critical_log_color,
+        }
+        self._level_names: Dict[int, str] = {
+            PieLogLevel.DEBUG: "DEBUG",
+            PieLogLevel.INFO: "INFO",
+            PieLogLevel.WARNING: "WARNING",
+            PieLogLevel.ERROR: "ERROR",
+            PieLogLevel.CRITICAL: "CRITICAL",
+        }
+
+        # Padding widths are fixed per logger, so the line prefix is compiled
+        # once into %-style templates instead of rebuilding f-strings per call.
+        self._console_template = (
+            f"%s%-{timestamp_padding}s %s%-{log_level_padding}s %s%-{file_path_padding}s : %s%s"
+        )
+        self._file_template = (
+            f"%-{timestamp_padding}s %-{log_level_padding}s %-{file_path_padding}s : %s"
+        )
 
         self._log_to_file = log_to_file
         self._relative_log_directory_path = relative_log_directory_path
         self._log_file_size_limit = log_file_size_limit
         self._max_backup_files = max_backup_files
+        self._use_uring = use_uring
         self._global_context = global_context
         self._context: Dict[str, Any] = {}
+        self._relpath_cache: Dict[str, str] = {}
 
         self.__initialize_logger()
 
+        # SimpleQueue's C implementation enqueues without acquiring a Python
+        # lock or condition variable, so producers never contend on a mutex.
+        self._log_queue: "queue.SimpleQueue[Optional[_LogRecord]]" = queue.SimpleQueue()
+        self._writer_thread = Thread(
+            target=self.__writer_loop,
+            name=f"{logger_name}_pie_log_writer",
+            daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.__drain_writer)
+
+        self.__specialize_level_methods()
+
+    def __specialize_level_methods(self) -> None:
+        """
+        Bind per-level instance methods specialized for the configured minimum level.
+
+        Levels below the threshold become a shared no-op, so e.g. logger.debug(...)
+        under the default INFO minimum costs a single call into an empty function.
+        Enabled levels get a closure with the level constant baked in, skipping the
+        class-level method dispatch on every call. The class methods remain as the
+        documented API and as fallbacks.
+        """
+        for name, level in (
+                ('debug', PieLogLevel.DEBUG),
+                ('info', PieLogLevel.INFO),
+                ('warning', PieLogLevel.WARNING),
+                ('error', PieLogLevel.ERROR),
+                ('critical', PieLogLevel.CRITICAL),
+        ):
+            if level < self._minimum_log_level:
+                setattr(self, name, _disabled_log)
+            else:
+                setattr(self, name, self.__make_level_method(level))
+
+    def __make_level_method(self, level: int) -> Callable[..., None]:
+        """Build a level method with the level constant and __log captured in a closure."""
+        log = self.__log
+
+        def level_method(
+                message: str,
+                details: Optional[Any] = None,
+                print_exception: Union[bool, BaseException] = False,
+                colorful: Optional[bool] = None
+        ) -> None:
+            log(level, message, details, print_exception, colorful)
+
+        return level_method
+
     def __initialize_logger(self) -> None:
         """
         Set up console and file logging handlers with appropriate formatting and rotation policies.
@@ -146,16 +266,90 @@ class PieLogger:
             self.file_logger = logging.getLogger(f"{self._logger_name}_file")
             self.file_logger.setLevel(self._minimum_log_level)
 
-            # Create a RotatingFileHandler
-            file_handler = RotatingFileHandler(
-                filename=log_file_path,
-                maxBytes=self._log_file_size_limit,
-                backupCount=self._max_backup_files
-            )
+            file_handler: logging.Handler
+            if self._use_uring:
+                try:
+                    from .pie_uring_handler import PieUringFileHandler
+                    file_handler = PieUringFileHandler(
+                        filename=log_file_path,
+                        maxBytes=self._log_file_size_limit,
+                        backupCount=self._max_backup_files
+                    )
+                except (ImportError, OSError):
+                    # liburing missing or the kernel lacks io_uring support;
+                    # the buffered handler below is the portable fallback.
+                    file_handler = self.__create_file_handler(log_file_path)
+            else:
+                file_handler = self.__create_file_handler(log_file_path)
 
             # Add the file handler to the logger
             self.file_logger.addHandler(file_handler)
 
+    def __create_file_handler(self, log_file_path: str) -> PieFileHandler:
+        """Create the default buffered rotating file handler."""
+        return PieFileHandler(
+            filename=log_file_path,
+            maxBytes=self._log_file_size_limit,
+            backupCount=self._max_backup_files
+        )
+
+    def __writer_loop(self) -> None:
+        """
+        Consume queued records and write them to the configured sinks.
+
+        Runs on a dedicated daemon thread so slow console/file I/O (including
+        file rotation) never blocks the threads producing log calls. A None
+        sentinel stops the loop after all earlier records have been written.
+        """
+        while True:
+            record = self._log_queue.get()
+            if record is None:
+                break
+            try:
+                self.__write_record(record)
+            except Exception:
+                traceback.print_exc()
+
+    def __write_record(self, record: _LogRecord) -> None:
+        """
+        Assemble and emit a single queued record to the console and file sinks.
+
+        When colors are off for this record the console and file bodies would
+        be identical, so the plain line is built once and written to both sinks.
+
+        Args:
+            record (_LogRecord): Precomputed record fields captured by __log
+        """
+        (level, message, timestamp, level_name, file_path_info,
+         details_str, context_str, exception_str, colorful) = record
+
+        is_colorful = self._effective_colorful if colorful is None else colorful
+
+        plain_log: Optional[str] = None
+        if not is_colorful or self._log_to_file:
+            plain_log = self.__file_log(
+                message, timestamp, level_name, file_path_info,
+                details_str, context_str, exception_str
+            )
+
+        if is_colorful:
+            console_log = self.__console_log(
+                level, message, timestamp, level_name, file_path_info,
+                details_str, context_str, exception_str, colorful
+            )
+        else:
+            console_log = plain_log
+
+        self.console_logger.log(level, console_log)
+
+        if self._log_to_file:
+            self.file_logger.log(level, plain_log)
+
+    def __drain_writer(self) -> None:
+        """Flush all pending records and stop the writer thread at interpreter exit."""
+        self._log_queue.put(None)
+        self._writer_thread.join(timeout=5.0)
+
     def __extract_caller_location(self) -> str:
         """
         Extract file path and line number information from the call stack.
@@ -163,16 +357,16 @@ class PieLogger:
         Returns:
             str: Formatted string containing relative file path and line number
         """
-        frame = inspect.stack()[4]
-        file_name = frame.filename
-        line_number = frame.lineno
+        frame = sys._getframe(3)
+        file_name = frame.f_code.co_filename
 
-        project_root = self._project_root
-        relative_file_name = os.path.relpath(file_name, project_root)
-        relative_file_name = f"./{relative_file_name.replace(os.sep, '/')}"
+        relative_file_name = self._relpath_cache.get(file_name)
+        if relative_file_name is None:
+            relative_file_name = os.path.relpath(file_name, self._project_root)
+            relative_file_name = f"./{relative_file_name.replace(os.sep, '/')}"
+            self._relpath_cache[file_name] = relative_file_name
 
-        file_path_info = f"{relative_file_name}:{line_number}"
-        return file_path_info
+        return f"{relative_file_name}:{frame.f_lineno}"
 
     def __get_timestamp(self) -> str:
         """
@@ -181,11 +375,8 @@ class PieLogger:
         Returns:
             str: Formatted timestamp string with millisecond precision
         """
-        current_time = datetime.now(pytz.utc)
-        if self._timezone:
-            tz = pytz.timezone(self._timezone)
-            current_time = current_time.astimezone(tz)
-        return current_time.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        current_time = datetime.now(self._tz)
+        return current_time.isoformat(sep=' ', timespec='milliseconds')[:23]
 
     def __get_color_from_level(self, level: int) -> Fore:
         """
@@ -197,18 +388,7 @@ class PieLogger:
         Returns:
             Fore: Colorama color code for the specified log level
         """
-        if level == PieLogLevel.DEBUG:
-            return self._debug_log_color
-        elif level == PieLogLevel.INFO:
-            return self._info_log_color
-        elif level == PieLogLevel.WARNING:
-            return self._warning_log_color
-        elif level == PieLogLevel.ERROR:
-            return self._error_log_color
-        elif level == PieLogLevel.CRITICAL:
-            return self._critical_log_color
-
-        return self._default_log_color
+        return self._level_colors.get(level, self._default_log_color)
 
     def __get_final_color(self, color: Fore, colorful: Optional[bool]) -> Fore:
         """
@@ -221,7 +401,7 @@ class PieLogger:
         Returns:
             Final color to use, accounting for color enable/disable settings
         """
-        is_colorful = self._colorful
+        is_colorful = self._effective_colorful
         if colorful is not None:
             is_colorful = colorful
         return color if is_colorful else self._default_log_color
@@ -245,6 +425,26 @@ class PieLogger:
 
         return str(obj)
 
+    def __format_details(self, details: Any) -> str:
+        """
+        Serialize a details structure to a JSON string using orjson.
+
+        Args:
+            details (Any): Structure to serialize; non-serializable objects fall back to str()
+
+        Returns:
+            str: JSON-formatted string, indented according to the logger's configuration
+        """
+        serializable_details = self.__make_serializable(details)
+        try:
+            return orjson.dumps(serializable_details, default=str, option=self._orjson_opts).decode()
+        except TypeError:
+            # orjson rejects some payloads stdlib json accepts (e.g. containers
+            # nested deeper than 254 levels); a log call must not raise on them.
+            if self._details_indent:
+                return json.dumps(serializable_details, indent=2, default=str)
+            return json.dumps(serializable_details, separators=(',', ':'), default=str)
+
     def add_context(self, key: str, value: Any) -> None:
         """
         Add or update a key-value pair in the logger's context.
@@ -275,101 +475,89 @@ class PieLogger:
             self,
             level: int,
             message: str,
-            details: Optional[Any],
-            print_exception: Optional[Union[bool, Exception]],
+            timestamp: str,
+            level_name: str,
+            file_path_info: str,
+            details_str: Optional[str],
+            context_str: Optional[str],
+            exception_str: Optional[str],
             colorful: Optional[bool]
     ) -> str:
         """
-        Format a log message for console output with optional color and styling.
+        Assemble a log message for console output with optional color and styling.
 
         Args:
             level (int): Logging level
             message (str): Main log message
-            details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (Optional[Union[bool, Exception]]): Exception object or boolean for error stack trace inclusion
+            timestamp (str): Precomputed timestamp string
+            level_name (str): Precomputed log level name
+            file_path_info (str): Precomputed caller location string
+            details_str (Optional[str]): Precomputed JSON details string
+            context_str (Optional[str]): Precomputed JSON context string
+            exception_str (Optional[str]): Precomputed exception stack trace
             colorful (Optional[bool]): Override for color output settings
 
         Returns:
             str: Formatted log message string with color codes and styling
         """
-        with self._log_lock:
-            timestamp_log_color = self.__get_final_color(self._timestamp_log_color, colorful)
-            file_path_log_color = self.__get_final_color(self._file_path_log_color, colorful)
-            details_log_color = self.__get_final_color(self._details_log_color, colorful)
-            level_color = self.__get_final_color(self.__get_color_from_level(level), colorful)
-            level_name = PieLogLevel.get_level_str(level)
-
-            file_path_info = self.__extract_caller_location()
-            timestamp = self.__get_timestamp()
-
-            console_log_parts = [
-                f"{timestamp_log_color}{timestamp:<{self._timestamp_padding}}",
-                f"{level_color}{level_name:<{self._log_level_padding}}",
-                f"{file_path_log_color}{file_path_info:<{self._file_path_padding}}",
-                f": {level_color}{message}"
-            ]
-            console_log = " ".join(console_log_parts)
-
-            if details:
-                serializable_details = self.__make_serializable(details)
-                formatted_details = json.dumps(serializable_details, indent=self._details_indent)
-                console_log += f"\n{details_log_color}{formatted_details}"
-
-            if self._global_context and self._context:
-                context_details = self.__make_serializable(self._context)
-                formatted_context = json.dumps(context_details, indent=self._details_indent)
-                console_log += f"\n{details_log_color}Context: {formatted_context}"
-
-            if print_exception:
-                exec_details = ''.join(traceback.format_exc())
-                console_log += f"\n{level_color}{exec_details}"
-
-            return console_log + f"{Style.RESET_ALL}"
+        timestamp_log_color = self.__get_final_color(self._timestamp_log_color, colorful)
+        file_path_log_color = self.__get_final_color(self._file_path_log_color, colorful)
+        details_log_color = self.__get_final_color(self._details_log_color, colorful)
+        level_color = self.__get_final_color(self.__get_color_from_level(level), colorful)
+
+        console_log = self._console_template % (
+            timestamp_log_color, timestamp,
+            level_color, level_name,
+            file_path_log_color, file_path_info,
+            level_color, message
+        )
+
+        if details_str is not None:
+            console_log += f"\n{details_log_color}{details_str}"
+
+        if context_str is not None:
+            console_log += f"\n{details_log_color}Context: {context_str}"
+
+        if exception_str is not None:
+            console_log += f"\n{level_color}{exception_str}"
+
+        return console_log + self._reset
 
     def __file_log(
             self,
-            level: int,
             message: str,
-            details: Optional[Any],
-            print_exception: Optional[Union[bool, Exception]]
+            timestamp: str,
+            level_name: str,
+            file_path_info: str,
+            details_str: Optional[str],
+            context_str: Optional[str],
+            exception_str: Optional[str]
     ) -> str:
         """
-        Format a log message for file output without color codes or styling.
+        Assemble a log message for file output without color codes or styling.
 
         Args:
-            level (int): Logging severity level
             message (str): Main log message text
-            details (Optional[Any]: Additional contextual data to include as formatted JSON
-            print_exception (bool): Exception information or flag for error stack trace inclusion
+            timestamp (str): Precomputed timestamp string
+            level_name (str): Precomputed log level name
+            file_path_info (str): Precomputed caller location string
+            details_str (Optional[str]): Precomputed JSON details string
+            context_str (Optional[str]): Precomputed JSON context string
+            exception_str (Optional[str]): Precomputed exception stack trace
 
         Returns:
             Formatted log message string suitable for file output
         """
-        timestamp = self.__get_timestamp()
-        level_name = PieLogLevel.get_level_str(level)
-        file_path_info = self.__extract_caller_location()
-
-        file_log_parts = [
-            f"{timestamp:<{self._timestamp_padding}}",
-            f"{level_name:<{self._log_level_padding}}",
-            f"{file_path_info:<{self._file_path_padding}}",
-            f": {message}"
-        ]
-        file_log = " ".join(file_log_parts)
+        file_log = self._file_template % (timestamp, level_name, file_path_info, message)
 
-        if details:
-            serializable_details = self.__make_serializable(details)
-            formatted_details = json.dumps(serializable_details, indent=self._details_indent)
-            file_log += f"\n{formatted_details}"
+        if details_str is not None:
+            file_log += f"\n{details_str}"
 
-        if self._global_context and self._context:
-            context_details = self.__make_serializable(self._context)
-            formatted_context = json.dumps(context_details, indent=self._details_indent)
-            file_log += f"\nContext: {formatted_context}"
+        if context_str is not None:
+            file_log += f"\nContext: {context_str}"
 
-        if print_exception:
-            exec_details = ''.join(traceback.format_exc())
-            file_log += f"\n{exec_details}"
+        if exception_str is not None:
+            file_log += f"\n{exception_str}"
 
         return file_log
 
@@ -378,32 +566,59 @@ class PieLogger:
             level: int,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
-        Process and output a log message to all configured destinations.
+        Capture a log record and hand it to the background writer thread.
+
+        The caller only pays for capturing call-site state that must be read on
+        this thread (caller frame, timestamp, JSON snapshot of details/context,
+        and the thread-local exception state); string assembly and all sink I/O
+        happen on the writer thread.
 
         Args:
             level (int): Logging level
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
-        console_log = self.__console_log(level, message, details, print_exception, colorful)
-        self.console_logger.log(level, console_log)
+        if level < self._minimum_log_level:
+            return
 
-        if self._log_to_file:
-            file_log = self.__file_log(level, message, details, print_exception)
-            self.file_logger.log(level, file_log)
+        if not self.console_logger.isEnabledFor(level) and not (
+                self._log_to_file and self.file_logger.isEnabledFor(level)):
+            return
+
+        timestamp = self.__get_timestamp()
+        level_name = self._level_names.get(level, "UNKNOWN")
+        file_path_info = self.__extract_caller_location()
+        details_str = self.__format_details(details) if details else None
+        context_str = self.__format_details(dict(self._context)) if self._global_context and self._context else None
+        if isinstance(print_exception, BaseException):
+            exception_str = ''.join(traceback.format_exception(
+                type(print_exception), print_exception, print_exception.__traceback__
+            ))
+        elif print_exception and sys.exc_info()[0] is not None:
+            exception_str = traceback.format_exc()
+        else:
+            # print_exception=True outside an except block would only produce
+            # a useless 'NoneType: None' line, so skip the stack walk.
+            exception_str = None
+
+        self._log_queue.put((
+            level, message, timestamp, level_name, file_path_info,
+            details_str, context_str, exception_str, colorful
+        ))
 
     def log(
             self,
             level: int,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -413,7 +628,8 @@ class PieLogger:
             level (int): Logging level
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(level, message, details, print_exception, colorful)
@@ -422,7 +638,7 @@ class PieLogger:
             self,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -431,7 +647,8 @@ class PieLogger:
         Args:
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(PieLogLevel.DEBUG, message, details, print_exception, colorful)
@@ -440,7 +657,7 @@ class PieLogger:
             self,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -449,7 +666,8 @@ class PieLogger:
         Args:
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(PieLogLevel.INFO, message, details, print_exception, colorful)
@@ -458,7 +676,7 @@ class PieLogger:
             self,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -467,7 +685,8 @@ class PieLogger:
         Args:
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(PieLogLevel.WARNING, message, details, print_exception, colorful)
@@ -476,7 +695,7 @@ class PieLogger:
             self,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -485,7 +704,8 @@ class PieLogger:
         Args:
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(PieLogLevel.ERROR, message, details, print_exception, colorful)
@@ -494,7 +714,7 @@ class PieLogger:
             self,
             message: str,
             details: Optional[Any] = None,
-            print_exception: bool = False,
+            print_exception: Union[bool, BaseException] = False,
             colorful: Optional[bool] = None
     ) -> None:
         """
@@ -503,7 +723,8 @@ class PieLogger:
         Args:
             message (str): Main log message
             details (Optional[Any]): Additional structured data to include as JSON
-            print_exception (bool): Whether to include error trace
+            print_exception (Union[bool, BaseException]): Whether to include the active
+                error trace, or an exception instance to format directly
             colorful (Optional[bool]): Whether to apply colors to this specific message
         """
         self.__log(PieLogLevel.CRITICAL, message, details, print_exception, colorful)
@@ -580,7 +801,7 @@ class PieLogger:
                     level=start_message_log_level,
                     message=start_msg,
                     details=start_details,
-                    colorful=self._colorful
+                    colorful=self._effective_colorful
                 )
 
                 # Execute function
@@ -599,7 +820,7 @@ class PieLogger:
                     level=end_message_log_level,
                     message=end_msg,
                     details=end_details,
-                    colorful=self._colorful
+                    colorful=self._effective_colorful
                 )
 
                 return result